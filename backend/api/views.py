@@ -1,10 +1,27 @@
 # api_tests.py
+import functools
+import json
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.contrib.auth.models import User
 from api.models import Note
-from rest_framework.exceptions import NotFound
+
+
+# Encoded once so create tests don't run the JSON renderer per request
+_NOTE_DATA = {'title': 'New Note', 'content': 'Some content'}
+_NOTE_JSON = json.dumps(_NOTE_DATA).encode()
+_INVALID_NOTE_DATA = {'title': '', 'content': 'Some content'}  # Invalid - empty title
+_INVALID_NOTE_JSON = json.dumps(_INVALID_NOTE_DATA).encode()
+
+
+@functools.lru_cache(maxsize=32)
+def _url(name, *args):
+    """Resolves a URL name once per (name, args)."""
+    return reverse(name, args=args or None)
 
 # -------------------------------------------------------------------
 # FIXTURES (Mocked setup for tests)
@@ -34,12 +51,32 @@ def mock_note(mocker, mock_user):
     return note
 
 @pytest.fixture
-def auth_client(mocker, mock_user):
-    """Returns an authenticated APIClient with a mock user."""
-    client = APIClient()
+def create_user(db):
+    """Returns a real User saved in the test database."""
+    # Hashed with the MD5 hasher from conftest.py, so this stays cheap
+    return User.objects.create_user(username='ilyes', password='mypassword')
+
+@pytest.fixture
+def create_notes(db, create_user):
+    """Returns a factory that inserts n notes for create_user in one query."""
+    def _make(n):
+        return Note.objects.bulk_create(
+            [Note(title=f'Note {i}', content='Some content', author=create_user) for i in range(n)]
+        )
+    return _make
+
+@pytest.fixture
+def auth_client(client, mock_user):
+    """Returns the client fixture, authenticated with a mock user."""
     client.force_authenticate(user=mock_user)
     return client
 
+@pytest.fixture
+def user_client(client, create_user):
+    """Returns the client fixture, authenticated as the real create_user."""
+    client.force_authenticate(user=create_user)
+    return client
+
 # -------------------------------------------------------------------
 # TESTS FOR USER REGISTRATION
 # -------------------------------------------------------------------
@@ -48,7 +85,7 @@ def test_user_registration(client, mocker):
     """
     Test that POST /register/ successfully creates a new user.
     """
-    url = reverse('create-user')
+    url = _url('create-user')
     data = {'username': 'ilyes2', 'password': 'mypassword'}
     
     # Mock User.objects.create_user
@@ -68,7 +105,7 @@ def test_list_notes(auth_client, mocker, mock_user, mock_note):
     """
     Test GET /notes/
     """
-    url = reverse('note-list')
+    url = _url('note-list')
     
     # Mock Note.objects.filter to return a queryset with our mock note
     mock_queryset = mocker.MagicMock()
@@ -85,12 +122,22 @@ def test_list_notes(auth_client, mocker, mock_user, mock_note):
     assert response.data[0]['title'] == "Test Note"
     Note.objects.filter.assert_called_once_with(author=mock_user)
 
+def test_list_notes_many(user_client, create_notes):
+    """
+    Test GET /notes/ with several stored notes
+    """
+    create_notes(5)
+    
+    response = user_client.get(_url('note-list'), format='json')
+    
+    assert response.status_code == 200
+    assert len(response.data) == 5
+
 def test_create_note(auth_client, mocker, mock_user):
     """
     Test POST /notes/
     """
-    url = reverse('note-list')
-    data = {'title': 'New Note', 'content': 'Some content'}
+    url = _url('note-list')
     
     # Mock Note serializer and save
     mock_serializer = mocker.patch('api.serializers.NoteSerializer')
@@ -99,18 +146,17 @@ def test_create_note(auth_client, mocker, mock_user):
     mock_serializer_instance.save.return_value = None
     mock_serializer_instance.data = {'id': 1, 'title': 'New Note', 'content': 'Some content'}
     
-    response = auth_client.post(url, data, format='json')
+    response = auth_client.post(url, _NOTE_JSON, content_type='application/json')
     
     assert response.status_code == 201
     mock_serializer_instance.save.assert_called_once_with(author=mock_user)
-    mock_serializer.assert_called_once_with(data=data)
+    mock_serializer.assert_called_once_with(data=_NOTE_DATA)
 
-def test_create_note_invalid(auth_client, mocker, mock_user):
+def test_create_note_invalid(auth_client, mocker):
     """
     Test POST /notes/ with invalid data
     """
-    url = reverse('note-list')
-    data = {'title': '', 'content': 'Some content'}  # Invalid - empty title
+    url = _url('note-list')
     
     # Mock serializer to return invalid
     mock_serializer = mocker.patch('api.serializers.NoteSerializer')
@@ -118,48 +164,31 @@ def test_create_note_invalid(auth_client, mocker, mock_user):
     mock_serializer_instance.is_valid.return_value = False
     mock_serializer_instance.errors = {'title': ['This field may not be blank.']}
     
-    response = auth_client.post(url, data, format='json')
+    response = auth_client.post(url, _INVALID_NOTE_JSON, content_type='application/json')
     
     assert response.status_code == 400
-    mock_serializer.assert_called_once_with(data=data)
-
-def test_delete_note(auth_client, mocker, mock_user, mock_note):
-    """
-    Test DELETE /notes/delete/<id>/
-    """
-    url = reverse('delete-note', args=[mock_note.id])
-    
-    # Mock get_queryset to return our mock note
-    mock_queryset = mocker.MagicMock()
-    mock_queryset.filter.return_value.first.return_value = mock_note
-    mocker.patch(
-        'api.views.NoteDelete.get_queryset',
-        return_value=mock_queryset
-    )
-    
-    # Mock note deletion
-    mock_delete = mocker.patch.object(mock_note, 'delete')
-    
-    response = auth_client.delete(url)
-    
-    assert response.status_code == 204
-    mock_delete.assert_called_once()
+    mock_serializer.assert_called_once_with(data=_INVALID_NOTE_DATA)
 
-def test_cannot_delete_other_users_note(auth_client, mocker, mock_user):
+@pytest.mark.parametrize('author_kind,expected_status,expected_count', [
+    pytest.param('self', 204, 0, id='own-note'),
+    pytest.param('other', 404, 1, id='other-users-note'),
+])
+def test_delete_note(user_client, create_user,
+                     author_kind, expected_status, expected_count):
     """
-    Test that a user cannot delete another user's note.
+    Test DELETE /notes/delete/<id>/ only deletes the requesting user's notes.
     """
-    url = reverse('delete-note', args=[2])  # Note ID that doesn't belong to user
+    owner = create_user if author_kind == 'self' else User.objects.create(username='other')
+    note = Note.objects.create(title='Test Note', content='Some content', author=owner)
+    url = _url('delete-note', note.id)
     
-    # Mock get_queryset to return empty queryset
-    mock_queryset = mocker.MagicMock()
-    mock_queryset.filter.return_value.first.return_value = None
-    mocker.patch(
-        'api.views.NoteDelete.get_queryset',
-        return_value=mock_queryset
-    )
+    with CaptureQueriesContext(connection) as ctx:
+        response = user_client.delete(url)
     
-    response = auth_client.delete(url)
+    # The object lookup must filter by author in SQL, not only by pk
+    where = ctx.captured_queries[0]['sql'].split('WHERE', 1)[1]
+    assert '"author_id"' in where
+    assert '"id"' in where
     
-    assert response.status_code == 404
-    mock_queryset.filter.assert_called_once_with(id=2)
\ No newline at end of file
+    assert response.status_code == expected_status
+    assert Note.objects.filter(id=note.id).count() == expected_count